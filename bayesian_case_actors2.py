@@ -692,3 +692,211 @@ print(inference.query([sanctions], evidence=evidence))
 
 print("\nP(O_Escalation_Risk | evidence):")
 print(inference.query([escal], evidence=evidence))
+
+# -----------------------------------------------------------------------------
+# Explanation trace: per-evidence log-likelihood-ratio contributions
+# -----------------------------------------------------------------------------
+# Leave-one-out (how much did E_i move H given everything else) and add-one-in
+# (how much does E_i move H on its own) both need P(H | some subset of evidence).
+# Instead of one full query per item, we run ONE elimination that keeps H and all
+# the evidence items, with only the background (reliability) clamped:
+#   P(H, E_1..E_n | rel)   -> 5 * 2^n entries, every subset query is a lookup.
+# The joint doubles with every item, so this only works for a small n (9 here).
+evidence_items = [e_vendor, e_patient, e_logic, e_drone_coord, e_drone_low, e_serial, e_tight, e_fog, e_fastmsg]
+
+def evidence_joint(inference, evidence, hypothesis=H, items=None):
+    """
+    Shared computation for the explanation trace.
+    `items` are the observed nodes to explain (default: the e_* nodes present in
+    `evidence`); anything else in `evidence` is background and stays clamped.
+    """
+    if items is None:
+        items = [v for v in evidence_items if v in evidence]
+    missing = [v for v in items if v not in evidence]
+    if missing:
+        raise ValueError(f"items not observed in evidence: {missing}")
+    items = list(items)
+    background = {v: s for v, s in evidence.items() if v not in items}
+    joint = inference.query([hypothesis] + items, evidence=background, joint=True, show_progress=False)
+    return joint, items
+
+def posterior_from_joint(joint, observed, hypothesis=H):
+    # P(H | observed) from the cached joint: reduce observed items, sum out the rest
+    phi = joint.reduce(list(observed.items()), inplace=False) if observed else joint.copy()
+    others = [v for v in phi.variables if v != hypothesis]
+    if others:
+        phi.marginalize(others)
+    phi.normalize()
+    return phi.values
+
+def log_odds(p):
+    # log-odds of each sponsor against all the others (natural log)
+    p = np.clip(p, 1e-12, 1 - 1e-12)
+    return np.log(p / (1 - p))
+
+def explain_evidence(inference, evidence, hypothesis=H, items=None):
+    """
+    Per-evidence log-likelihood-ratio contributions toward each sponsor.
+    Returns {item: {"loo": array, "add": array}} where, per sponsor h,
+      loo[h] = logodds(h | all evidence) - logodds(h | all evidence except item)
+      add[h] = logodds(h | background + item) - logodds(h | background)
+    Positive values mean the item pushed towards sponsor h.
+    `items` defaults to the e_* nodes present in `evidence` (see evidence_joint).
+    """
+    joint, items = evidence_joint(inference, evidence, hypothesis, items)
+    obs = {v: evidence[v] for v in items}
+
+    lo_full = log_odds(posterior_from_joint(joint, obs, hypothesis))
+    lo_prior = log_odds(posterior_from_joint(joint, {}, hypothesis))
+
+    trace = {}
+    for item in items:
+        rest = {v: s for v, s in obs.items() if v != item}
+        lo_without = log_odds(posterior_from_joint(joint, rest, hypothesis))
+        lo_alone = log_odds(posterior_from_joint(joint, {item: obs[item]}, hypothesis))
+        trace[item] = {"loo": lo_full - lo_without, "add": lo_alone - lo_prior}
+    return trace
+
+print("\nExplanation trace (log-LR contributions, leave-one-out | add-one-in):")
+trace = explain_evidence(inference, evidence)
+print(f"  {'':30s}" + "".join(f"{n:>20s}" for n in names))
+for item, contrib in trace.items():
+    cells = "".join(f"{l:>+9.3f} | {a:<+8.3f}" for l, a in zip(contrib["loo"], contrib["add"]))
+    print(f"  {item:30s}{cells}")
+
+# -----------------------------------------------------------------------------
+# Multi-incident campaign: unrolled slices + rolling-window filtering
+# -----------------------------------------------------------------------------
+# Within a campaign the same sponsor drives repeated cyber/drone operations.
+# Sponsor-level nodes (H, capabilities, motives, access, deception tendency and the
+# aggregators) are SHARED; each incident gets its own copy ("slice") of the
+# execution, reliability and evidence nodes. Attribution/consequence nodes are
+# per-decision, not per-incident, so they are left out of the slices.
+slice_nodes = [
+    planned, cyber, drone, coord,
+    rel_for, rel_int,
+    e_vendor, e_patient, e_logic, e_drone_coord, e_drone_low, e_serial, e_tight, e_fog, e_fastmsg,
+]
+
+# shared nodes a slice hangs from: conditioning on these cuts every slice off from
+# the sponsor and from the other slices, so they are all the filter has to carry.
+interface = [intent, means, opportunity, a_vendor, a_patient, cap_ics, cap_io, falseflag, proxy]
+
+def slice_name(node, k):
+    return f"{node}_t{k}"
+
+def slice_cpds(k, bn=model):
+    # copy of the single-incident CPDs of `bn` with slice-local variables renamed for incident k
+    cpds = []
+    for node in slice_nodes:
+        cpd = bn.get_cpds(node)
+        parents = cpd.variables[1:]
+        cpds.append(TabularCPD(
+            variable=slice_name(node, k), variable_card=cpd.variable_card,
+            values=cpd.get_values(),
+            evidence=[slice_name(p, k) if p in slice_nodes else p for p in parents] or None,
+            evidence_card=list(cpd.cardinality[1:]) or None
+        ))
+    return cpds
+
+def unroll_incidents(n_incidents, bn=model):
+    """
+    Offline/batch mode: one network with the shared sponsor-level nodes of `bn` and
+    `n_incidents` replicated slices. Grows with history, so use IncidentFilter online.
+    """
+    shared = [v for v in bn.nodes() if v not in slice_nodes and v not in (attr, sanctions, mil, escal)]
+    unrolled = DiscreteBayesianNetwork()
+    unrolled.add_nodes_from(shared)
+    unrolled.add_edges_from([(u, v) for u, v in bn.edges() if u in shared and v in shared])
+    unrolled.add_cpds(*[bn.get_cpds(v) for v in shared])
+    for k in range(n_incidents):
+        cpds = slice_cpds(k, bn)
+        for cpd in cpds:
+            unrolled.add_node(cpd.variable)
+            unrolled.add_edges_from([(p, cpd.variable) for p in cpd.variables[1:]])
+        unrolled.add_cpds(*cpds)
+    return unrolled
+
+def slice_likelihood(k, incident_evidence, bn=model):
+    """
+    P(incident evidence | interface) as a factor over the interface nodes only
+    (up to a constant). Built as a per-slice network with the interface nodes as
+    uniform roots, so Variable Elimination drops the unobserved (barren) slice
+    leaves and sums out the remaining hidden variables one at a time instead of
+    multiplying every slice CPD into one dense table.
+    """
+    unknown = [v for v in incident_evidence if v not in slice_nodes]
+    if unknown:
+        raise ValueError(f"not per-incident slice nodes: {unknown}")
+
+    cpds = slice_cpds(k, bn)
+    slice_bn = DiscreteBayesianNetwork()
+    slice_bn.add_nodes_from(interface + [cpd.variable for cpd in cpds])
+    for cpd in cpds:
+        slice_bn.add_edges_from([(p, cpd.variable) for p in cpd.variables[1:]])
+    for v in interface:
+        card = bn.get_cardinality(v)
+        slice_bn.add_cpds(TabularCPD(v, card, values=[[1.0 / card]] * card))
+    slice_bn.add_cpds(*cpds)
+
+    obs = {slice_name(v, k): s for v, s in incident_evidence.items()}
+    return VariableElimination(slice_bn).query(interface, evidence=obs, joint=True, show_progress=False)
+
+class IncidentFilter:
+    """
+    Online filtering over a campaign. The last `window` incidents are kept as
+    separate likelihood factors (so their evidence can still be revised when late
+    forensics arrive); older incidents are folded into a belief over
+    (H_sponsor, interface). Memory is bounded by the window, not the history.
+    """
+
+    def __init__(self, inference, window=5, hypothesis=H):
+        self.window = window
+        self.hypothesis = hypothesis
+        # slices are copied from the same network the prior comes from
+        self.bn = inference.model
+        # prior belief P(H, interface) from the shared part of the model
+        self.belief = inference.query([hypothesis] + interface, joint=True, show_progress=False)
+        self.recent = []   # [(incident index, evidence, likelihood factor)]
+        self.n_seen = 0
+
+    def add_incident(self, incident_evidence):
+        k = self.n_seen
+        self.recent.append((k, dict(incident_evidence), slice_likelihood(k, incident_evidence, self.bn)))
+        self.n_seen += 1
+        while len(self.recent) > self.window:
+            _, _, lik = self.recent.pop(0)
+            self.belief = self.belief * lik
+            self.belief.normalize()
+        return self.sponsor_posterior()
+
+    def revise(self, k, incident_evidence):
+        # replace the evidence of an incident that is still inside the window
+        for i, (j, _, _) in enumerate(self.recent):
+            if j == k:
+                self.recent[i] = (k, dict(incident_evidence), slice_likelihood(k, incident_evidence, self.bn))
+                return self.sponsor_posterior()
+        raise ValueError(f"incident {k} is outside the rolling window of {self.window}")
+
+    def sponsor_posterior(self):
+        phi = self.belief.copy()
+        for _, _, lik in self.recent:
+            phi = phi * lik
+        phi.marginalize([v for v in phi.variables if v != self.hypothesis])
+        phi.normalize()
+        return phi.values
+
+# Example campaign: the Freelandia incident, a cyber-only follow-up, a drone-only
+# probe with weaker reporting, and a fresh incident with a single vendor-path report.
+campaign = [
+    evidence,
+    {e_vendor: 1, e_patient: 1, e_logic: 1, e_drone_coord: 0, e_tight: 0, e_fog: 1, rel_for: 1, rel_int: 1},
+    {e_drone_coord: 1, e_drone_low: 1, e_serial: 0, e_fog: 0, rel_for: 0, rel_int: 0},
+    {e_vendor: 1},
+]
+
+print("\nCampaign filtering, P(H_sponsor | incidents so far):")
+campaign_filter = IncidentFilter(inference, window=2)
+for k, inc in enumerate(campaign):
+    post = campaign_filter.add_incident(inc)
+    print(f"  after incident {k}: " + ", ".join(f"{n} {p:.3f}" for n, p in zip(names, post)))